@@ -1,18 +1,10 @@
 'use strict';
 
-function _isFlag(token) {
-  const t = String(token || '');
-  return t.startsWith('-');
-}
+const HELP_FLAGS = new Set(['-h', '--help']);
 
-function _firstNonFlagIndex(argv) {
-  const args = Array.isArray(argv) ? argv : [];
-  for (let i = 0; i < args.length; i++) {
-    if (!args[i]) continue;
-    if (_isFlag(args[i])) continue;
-    return i;
-  }
-  return -1;
+// Every result has the same keys (unused ones are undefined).
+function _result(mode, command, argv, helpTopicTokens) {
+  return { mode, command, argv, helpTopicTokens };
 }
 
 /**
@@ -24,38 +16,50 @@ function _firstNonFlagIndex(argv) {
  * - repl: `pup` (no command) => read JSON lines from stdin
  */
 function parseCliArgs(argv) {
-  const args = Array.isArray(argv) ? argv.slice(0) : [];
+  const args = Array.isArray(argv) ? argv : [];
 
-  const hasHelpFlag = args.includes('-h') || args.includes('--help');
-  const idx = _firstNonFlagIndex(args);
+  // Single pass: help flag, first positional (the command) and the
+  // positionals after it (help topic tokens).
+  let idx = -1;
+  let hasHelpFlag = false;
+  const topicTokens = [];
+  for (let i = 0; i < args.length; i++) {
+    const t = args[i];
+    if (!t) continue;
+    const s = String(t);
+    if (HELP_FLAGS.has(s)) {
+      hasHelpFlag = true;
+      continue;
+    }
+    if (s[0] === '-') continue;
+    if (idx < 0) idx = i;
+    else topicTokens.push(t);
+  }
 
-  const cmdRaw = idx >= 0 ? String(args[idx] || '') : '';
-  const cmd = cmdRaw.trim().toLowerCase();
-  const rest = idx >= 0 ? args.slice(idx + 1) : [];
+  const cmd = idx >= 0 ? String(args[idx]).trim().toLowerCase() : '';
 
   // `help` command explicitly
   if (cmd === 'help') {
-    const topicTokens = rest.filter((t) => t && !String(t).startsWith('-'));
-    return { mode: 'help', helpTopicTokens: topicTokens };
+    return _result('help', undefined, undefined, topicTokens);
   }
 
   // `--help` works both globally and per-command
   if (hasHelpFlag) {
     // if a command exists, treat it as `help <cmd> ...`
-    if (idx >= 0 && cmd) {
-      const topicTokens = [cmd, ...rest.filter((t) => t && !String(t).startsWith('-'))];
-      return { mode: 'help', helpTopicTokens: topicTokens };
+    if (cmd) {
+      topicTokens.unshift(cmd);
+      return _result('help', undefined, undefined, topicTokens);
     }
-    return { mode: 'help', helpTopicTokens: [] };
+    return _result('help', undefined, undefined, []);
   }
 
   // command mode
-  if (idx >= 0 && cmd) {
-    return { mode: 'command', command: cmd, argv: rest };
+  if (cmd) {
+    return _result('command', cmd, args.slice(idx + 1), undefined);
   }
 
   // repl mode
-  return { mode: 'repl' };
+  return _result('repl', undefined, undefined, undefined);
 }
 
 module.exports = {
@@ -3,21 +3,26 @@
 const path = require('path');
 const { brightCyan, bold, gray } = require('../utils/colors');
 
+let _version = null;
+let _banner = null;
+
 function getVersion() {
+  if (_version !== null) return _version;
+  _version = '0.0.0';
   // Best effort: resolve package.json relative to src/
   try {
     const pkg = require(path.join(__dirname, '..', '..', 'package.json'));
-    if (pkg && pkg.version) return String(pkg.version);
+    if (pkg && pkg.version) _version = String(pkg.version);
   } catch {}
-  return '0.0.0';
+  return _version;
 }
 
 // Banner (minimal, Vite-style)
 function printBanner() {
-  const version = getVersion();
-  console.log('');
-  console.log(`  ${bold(brightCyan('◆'))} ${bold('Pup')} ${gray('v' + version)}`);
-  console.log('');
+  if (_banner === null) {
+    _banner = `\n  ${bold(brightCyan('◆'))} ${bold('Pup')} ${gray('v' + getVersion())}\n`;
+  }
+  console.log(_banner);
 }
 
 module.exports = {
@@ -6,12 +6,18 @@
               formatDuration
             } = require('../utils/colors');
 
+// startTime is a process.hrtime.bigint() stamp (CLI/REPL) or a Date.now()-style epoch in ms.
+function _elapsedMs(startTime) {
+  if (typeof startTime === 'bigint') return Math.round(Number(process.hrtime.bigint() - startTime) / 1e6);
+  return Date.now() - startTime;
+}
+
             function formatText(res, startTime) {
   if (!res || typeof res !== 'object') return String(res);
 
   const lines = [];
   const cmd = res.cmd || '';
-  const duration = startTime ? formatDuration(Date.now() - startTime) : null;
+  const duration = startTime ? formatDuration(_elapsedMs(startTime)) : null;
 
   // Error case
   if (res.ok === false) {
@@ -6,37 +6,48 @@ const {
 } = require('../utils/colors');
 
 const ANSI_RE = /\x1b\[[0-9;]*m/g;
+const USAGE_ARG_RE = /<([^>]+)>/g;
+const WHITESPACE_RUN_RE = /\s+/g;
 
 function stripAnsi(s) {
   return String(s || '').replace(ANSI_RE, '');
 }
 
 function vlen(s) {
-  return stripAnsi(s).length;
+  const txt = String(s || '');
+  // Fast path: plain text needs no regex pass.
+  return txt.indexOf('\x1b') === -1 ? txt.length : stripAnsi(txt).length;
 }
 
-function padRight(s, width) {
-  const txt = String(s || '');
+// Measure the plain text, then colorize: the color codes never need to be stripped again.
+function padCell(text, width, colorize) {
+  const txt = String(text || '');
   const pad = Math.max(0, width - vlen(txt));
-  return txt + ' '.repeat(pad);
+  return colorize(txt) + ' '.repeat(pad);
 }
 
 function wrap(text, width, indent) {
   const w = Math.max(20, Number(width) || 80);
   const ind = ' '.repeat(Math.max(0, Number(indent) || 0));
-  const words = String(text || '').split(/\s+/).filter(Boolean);
+  const avail = w - ind.length;
+  // Collapse whitespace once; every output line is then a slice of `s`.
+  const s = String(text || '').replace(WHITESPACE_RUN_RE, ' ').trim();
+  const n = s.length;
   const out = [];
-  let line = '';
-  for (const word of words) {
-    if (!line) { line = word; continue; }
-    if ((line.length + 1 + word.length) > (w - ind.length)) {
-      out.push(ind + line);
-      line = word;
-    } else {
-      line += ' ' + word;
+  let lineStart = 0;
+  let lineEnd = -1;
+  let pos = 0;
+  while (pos < n) {
+    const sp = s.indexOf(' ', pos);
+    const wordEnd = sp === -1 ? n : sp;
+    if (lineEnd !== -1 && (wordEnd - lineStart) > avail) {
+      out.push(ind + s.slice(lineStart, lineEnd));
+      lineStart = pos;
     }
+    lineEnd = wordEnd;
+    pos = wordEnd + 1;
   }
-  if (line) out.push(ind + line);
+  if (lineEnd !== -1) out.push(ind + s.slice(lineStart, lineEnd));
   return out.join('\n');
 }
 
@@ -108,15 +119,6 @@ function _cmdList(kernel) {
   try { return kernel.listCommands(); } catch { return []; }
 }
 
-function _cmdInfo(kernel, name) {
-  if (kernel && typeof kernel.getCommandInfo === 'function') return kernel.getCommandInfo(name);
-  const n = norm(name);
-  for (const c of _cmdList(kernel)) {
-    if (norm(c.name) === n) return { name: n, plugin: c.plugin, spec: c };
-  }
-  return null;
-}
-
 function _pluginMetas(plugins) {
   if (plugins && typeof plugins.listPluginMetas === 'function') return plugins.listPluginMetas();
   try {
@@ -127,35 +129,91 @@ function _pluginMetas(plugins) {
   }
 }
 
-function _buildGlobal({ kernel, plugins, binName }) {
-  const lines = [];
+/**
+ * Per-render view over kernel/plugin introspection.
+ * Command and plugin lists are fetched lazily and at most once per buildHelpText call.
+ */
+function _helpSource(kernel, plugins) {
+  let commands = null;
+  let metas = null;
+  let cmdByName = null;
+  let metaByName = null;
+  let metaByNorm = null;
+
+  const src = {
+    commands() {
+      if (!commands) commands = _cmdList(kernel);
+      return commands;
+    },
+    metas() {
+      if (!metas) metas = _pluginMetas(plugins);
+      return metas;
+    },
+    metaByName() {
+      if (!metaByName) metaByName = new Map(src.metas().map((m) => [String(m.name), m]));
+      return metaByName;
+    },
+    metaByNorm() {
+      if (!metaByNorm) metaByNorm = new Map(src.metas().map((m) => [norm(m.name), m]));
+      return metaByNorm;
+    },
+    cmdInfo(name) {
+      if (kernel && typeof kernel.getCommandInfo === 'function') return kernel.getCommandInfo(name);
+      if (!cmdByName) cmdByName = new Map(src.commands().map((c) => [norm(c.name), c]));
+      const n = norm(name);
+      const c = cmdByName.get(n);
+      return c ? { name: n, plugin: c.plugin, spec: c } : null;
+    }
+  };
+  return src;
+}
 
-  lines.push(`${bold('Usage:')} ${cyan(`${binName} <command> [args...] [options]`)}`);
-  lines.push('');
-  lines.push(bold('Quick Start (beginner):'));
-  lines.push(`  ${gray('1)')} ${cyan(`${binName} goto https://www.google.com`)}`);
-  lines.push(`  ${gray('2)')} ${cyan(`${binName} scan`)} ${dim('# list elements and ids')}`);
-  lines.push(`  ${gray('3)')} ${cyan(`${binName} click <id>`)} ${dim('# click an element by id')}`);
-  lines.push(`  ${gray('4)')} ${cyan(`${binName} type <id> "hello" --enter`)} ${dim('# type and press Enter')}`);
-  lines.push('');
-  lines.push(bold('Help:'));
-  lines.push(`  ${cyan(`${binName} help`)} ${dim('# show all commands')}`);
-  lines.push(`  ${cyan(`${binName} help <command>`)} ${dim('# detailed command help')}`);
-  lines.push(`  ${cyan(`${binName} <command> --help`)} ${dim('# same as help <command>')}`);
-  lines.push('');
-  lines.push(bold('Output Options:'));
-  lines.push(`  ${cyan('--json, -j')}    ${gray('output JSONL (one JSON per line)')}`);
-  lines.push(`  ${cyan('--pretty')}     ${gray('pretty-printed JSON')}`);
-  lines.push('');
+// Static top of the global help page; only varies by binName.
+const _globalHeaders = new Map();
+
+function _globalHeader(binName) {
+  let text = _globalHeaders.get(binName);
+  if (text === undefined) {
+    text = [
+      `${bold('Usage:')} ${cyan(`${binName} <command> [args...] [options]`)}`,
+      '',
+      bold('Quick Start (beginner):'),
+      `  ${gray('1)')} ${cyan(`${binName} goto https://www.google.com`)}`,
+      `  ${gray('2)')} ${cyan(`${binName} scan`)} ${dim('# list elements and ids')}`,
+      `  ${gray('3)')} ${cyan(`${binName} click <id>`)} ${dim('# click an element by id')}`,
+      `  ${gray('4)')} ${cyan(`${binName} type <id> "hello" --enter`)} ${dim('# type and press Enter')}`,
+      '',
+      bold('Help:'),
+      `  ${cyan(`${binName} help`)} ${dim('# show all commands')}`,
+      `  ${cyan(`${binName} help <command>`)} ${dim('# detailed command help')}`,
+      `  ${cyan(`${binName} <command> --help`)} ${dim('# same as help <command>')}`,
+      '',
+      bold('Output Options:'),
+      `  ${cyan('--json, -j')}    ${gray('output JSONL (one JSON per line)')}`,
+      `  ${cyan('--pretty')}     ${gray('pretty-printed JSON')}`,
+      '',
+      // REPL note
+      bold('REPL Mode (JSON lines):'),
+      `  ${gray('Run without a command to read JSON from stdin.')}`,
+      `  ${dim('Example:')} ${cyan(`echo '{"cmd":"GOTO","url":"https://example.com"}' | ${binName} -j`)}`,
+      ''
+    ].join('\n');
+    _globalHeaders.set(binName, text);
+  }
+  return text;
+}
 
-  // REPL note
-  lines.push(bold('REPL Mode (JSON lines):'));
-  lines.push(`  ${gray('Run without a command to read JSON from stdin.')}`);
-  lines.push(`  ${dim('Example:')} ${cyan(`echo '{"cmd":"GOTO","url":"https://example.com"}' | ${binName} -j`)}`);
-  lines.push('');
+const OUTPUT_OPTIONS_HELP = [
+  bold('Output options (global):'),
+  `  ${padCell('--json, -j', 20, cyan)} ${gray('JSONL output (one JSON per line)')}`,
+  `  ${padCell('--pretty', 20, cyan)} ${gray('Pretty-printed JSON')}`
+].join('\n');
+
+function _buildGlobal({ src, binName }) {
+  const lines = [_globalHeader(binName)];
 
   // Commands grouped by plugin
-  const commands = _cmdList(kernel);
+  const commands = src.commands();
   const byPlugin = new Map();
   for (const c of commands) {
     const p = String(c.plugin || 'unknown');
@@ -163,8 +221,7 @@ function _buildGlobal({ kernel, plugins, binName }) {
     byPlugin.get(p).push(c);
   }
 
-  const metas = _pluginMetas(plugins);
-  const metaByName = new Map(metas.map((m) => [String(m.name), m]));
+  const metaByName = src.metaByName();
   const pluginNames = Array.from(byPlugin.keys()).sort((a, b) => a.localeCompare(b));
 
   lines.push(bold('Commands:'));
@@ -180,7 +237,7 @@ function _buildGlobal({ kernel, plugins, binName }) {
     for (const cmd of list) {
       const usage = cmd.usage ? String(cmd.usage) : String(cmd.name);
       const desc = cmd.description ? String(cmd.description) : '';
-      lines.push(`    ${padRight(cyan(usage), leftWidth)} ${gray(desc)}`.trimEnd());
+      lines.push(`    ${padCell(usage, leftWidth, cyan)} ${gray(desc)}`.trimEnd());
     }
   }
 
@@ -193,9 +250,9 @@ function _buildGlobal({ kernel, plugins, binName }) {
 function _inferArgsFromUsage(usage) {
   const u = String(usage || '');
   const args = [];
-  const re = /<([^>]+)>/g;
   let m;
-  while ((m = re.exec(u))) {
+  USAGE_ARG_RE.lastIndex = 0;
+  while ((m = USAGE_ARG_RE.exec(u))) {
     const raw = m[1].trim();
     if (!raw) continue;
     args.push({ name: raw, required: true });
@@ -203,13 +260,13 @@ function _inferArgsFromUsage(usage) {
   return args;
 }
 
-function _buildCommand({ kernel, plugins, binName, cmdName, subName }) {
-  const info = _cmdInfo(kernel, cmdName);
+function _buildCommand({ src, binName, cmdName, subName, info: knownInfo }) {
+  const info = knownInfo || src.cmdInfo(cmdName);
   if (!info) {
     const lines = [];
     lines.push(`${yellow('[!]')} ${yellow('Unknown command:')} ${cyan(cmdName)}`);
     lines.push('');
-    lines.push(_buildGlobal({ kernel, plugins, binName }));
+    lines.push(_buildGlobal({ src, binName }));
     return lines.join('\n');
   }
 
@@ -265,7 +322,7 @@ function _buildCommand({ kernel, plugins, binName, cmdName, subName }) {
     for (const a of inferredArgs) {
       const doc = argDocs.find((d) => norm(d.name) === norm(a.name)) || null;
       const right = doc && doc.desc ? doc.desc : 'Required argument.';
-      lines.push(`  ${padRight(cyan('<' + a.name + '>'), 20)} ${gray(right)}`.trimEnd());
+      lines.push(`  ${padCell('<' + a.name + '>', 20, cyan)} ${gray(right)}`.trimEnd());
     }
     lines.push('');
   }
@@ -275,14 +332,12 @@ function _buildCommand({ kernel, plugins, binName, cmdName, subName }) {
     for (const o of opts) {
       const flags = o && o.flags ? String(o.flags) : '';
       const od = o && o.description ? String(o.description) : '';
-      lines.push(`  ${padRight(cyan(flags), 20)} ${gray(od)}`.trimEnd());
+      lines.push(`  ${padCell(flags, 20, cyan)} ${gray(od)}`.trimEnd());
     }
     lines.push('');
   }
 
-  lines.push(bold('Output options (global):'));
-  lines.push(`  ${padRight(cyan('--json, -j'), 20)} ${gray('JSONL output (one JSON per line)')}`);
-  lines.push(`  ${padRight(cyan('--pretty'), 20)} ${gray('Pretty-printed JSON')}`);
+  lines.push(OUTPUT_OPTIONS_HELP);
   lines.push('');
 
   if (guide && Array.isArray(guide.notes) && guide.notes.length) {
@@ -310,12 +365,14 @@ function _buildCommand({ kernel, plugins, binName, cmdName, subName }) {
   return lines.join('\n');
 }
 
-function _buildPlugin({ kernel, plugins, binName, pluginName }) {
-  const name = String(pluginName || '');
-  const metas = _pluginMetas(plugins);
-  const meta = metas.find((m) => String(m.name) === name) || null;
+function _buildPlugin({ src, binName, pluginName, meta: knownMeta }) {
+  const meta = knownMeta || src.metaByName().get(String(pluginName || '')) || null;
+  // Use the plugin's real name, not the normalized help topic: a mixed-case plugin
+  // (e.g. an external `.pup` plugin "IP-Info" reached via `help ip-info`) must still
+  // match its description and commands.
+  const name = meta ? String(meta.name) : String(pluginName || '');
 
-  const commands = _cmdList(kernel).filter((c) => String(c.plugin) === name);
+  const commands = src.commands().filter((c) => String(c.plugin) === name);
   commands.sort((a, b) => String(a.name).localeCompare(String(b.name)));
 
   const lines = [];
@@ -330,7 +387,7 @@ function _buildPlugin({ kernel, plugins, binName, pluginName }) {
   for (const cmd of commands) {
     const usage = cmd.usage ? String(cmd.usage) : String(cmd.name);
     const desc = cmd.description ? String(cmd.description) : '';
-    lines.push(`  ${padRight(cyan(usage), 34)} ${gray(desc)}`.trimEnd());
+    lines.push(`  ${padCell(usage, 34, cyan)} ${gray(desc)}`.trimEnd());
   }
   lines.push('');
   lines.push(`${dim('Tip:')} ${gray(`Use "${binName} help <command>" for per-command help.`)}`);
@@ -339,24 +396,26 @@ function _buildPlugin({ kernel, plugins, binName, pluginName }) {
 
 function buildHelpText({ kernel, plugins, binName, topicTokens }) {
   const tokens = Array.isArray(topicTokens) ? topicTokens : [];
-  if (!tokens.length) return _buildGlobal({ kernel, plugins, binName });
+  const src = _helpSource(kernel, plugins);
+  if (!tokens.length) return _buildGlobal({ src, binName });
 
   const first = norm(tokens[0]);
   const second = tokens[1] ? norm(tokens[1]) : '';
 
-  if (_cmdInfo(kernel, first)) {
-    return _buildCommand({ kernel, plugins, binName, cmdName: first, subName: second || '' });
+  const info = src.cmdInfo(first);
+  if (info) {
+    return _buildCommand({ src, binName, cmdName: first, subName: second || '', info });
   }
 
-  const metas = _pluginMetas(plugins);
-  if (metas.some((m) => norm(m.name) === first)) {
-    return _buildPlugin({ kernel, plugins, binName, pluginName: first });
+  const meta = src.metaByNorm().get(first);
+  if (meta) {
+    return _buildPlugin({ src, binName, pluginName: first, meta });
   }
 
   const lines = [];
   lines.push(`${yellow('[!]')} ${yellow('Unknown help topic:')} ${cyan(tokens.join(' '))}`);
   lines.push('');
-  lines.push(_buildGlobal({ kernel, plugins, binName }));
+  lines.push(_buildGlobal({ src, binName }));
   return lines.join('\n');
 }
 
@@ -3,80 +3,164 @@
 const readline = require('readline');
 const { pickCorrelation, serializeError } = require('./serialize');
 
+/**
+ * Coalesce writes issued within the same event-loop turn into one stdout flush.
+ * The returned writer has a `flush()` that uncorks immediately; call it before exiting.
+ * @param {(obj:any, startTime?:bigint)=>void} writeLine
+ */
+function makeBatchedWriter(writeLine) {
+  const stdout = process.stdout;
+  let corked = false;
+
+  const flush = () => {
+    if (!corked) return;
+    corked = false;
+    stdout.uncork();
+  };
+
+  const write = (obj, startTime) => {
+    if (!corked) {
+      corked = true;
+      stdout.cork();
+      setImmediate(flush);
+    }
+    writeLine(obj, startTime);
+  };
+  write.flush = flush;
+  return write;
+}
+
+// Read-only commands: they may overlap each other, but never a state-changing command.
+// `status` relies on Kernel#page() sharing one in-flight selection (no duplicate tabs on a cold kernel).
+const PARALLEL_SAFE = new Set(['ping', 'status']);
+
+// Legacy REPL protocol mapping, keyed by upper-cased `cmd`.
+const LEGACY_HANDLERS = new Map([
+  ['PING', (kernel) => kernel.runCommand('ping', { argv: [] })],
+  ['STATUS', (kernel) => kernel.runCommand('status', { argv: [] })],
+  ['GOTO', (kernel, req) => kernel.runCommand('goto', { argv: [String(req.url || '')] })],
+  ['SCAN', (kernel) => kernel.runCommand('scan', { argv: [] })],
+  ['SCANALL', (kernel) => kernel.runCommand('scanall', { argv: [] })],
+  ['SCROLL', (kernel, req) => kernel.runCommand('scroll', { argv: [String(req.direction || 'down')] })],
+  ['ACT', (kernel, req) => kernel.runCommand('act', req)]
+]);
+
+// Pause stdin once this many requests are queued; resume at half.
+const QUEUE_HIGH_WATER = 64;
+
+function _commandName(req) {
+  return (req && req.cmd) ? String(req.cmd).trim().toLowerCase() : '';
+}
+
+/**
+ * Execute one parsed REPL request. Never rejects.
+ * @returns {Promise<{out:any, startTime:bigint}>}
+ */
+async function _execute(kernel, req) {
+  const corr = pickCorrelation(req);
+  const startTime = process.hrtime.bigint();
+
+  try {
+    const cmdRaw = (req && req.cmd) ? String(req.cmd) : '';
+    const cmd = cmdRaw.trim().toUpperCase();
+
+    let res;
+    const legacy = LEGACY_HANDLERS.get(cmd);
+    if (legacy) {
+      res = await legacy(kernel, req);
+    } else if (req && req.cmd && Array.isArray(req.argv)) {
+      // Direct command passthrough: { cmd: "click", argv: ["5"] }
+      res = await kernel.runCommand(String(req.cmd).toLowerCase(), { argv: req.argv });
+    } else {
+      throw new Error(`Unknown cmd: ${cmd}`);
+    }
+
+    if (corr !== null && corr !== undefined && res && typeof res === 'object') res.corr = corr;
+    return { out: res, startTime };
+  } catch (e) {
+    const out = { ok: false, error: serializeError(e) };
+    if (corr !== null && corr !== undefined) out.corr = corr;
+    return { out, startTime };
+  }
+}
+
 /**
  * REPL mode: read JSON lines from stdin.
  *
  * Protocols supported:
  * - Legacy: { cmd: "GOTO", url: "..." }, { cmd: "SCAN" }, ...
  * - Direct passthrough: { cmd: "click", argv: ["5"] }
+ *
+ * Requests run in order, except that consecutive PARALLEL_SAFE requests (ping/status)
+ * run concurrently. Responses are always written in request order.
+ * Input is paused while QUEUE_HIGH_WATER requests are pending.
  */
-async function runRepl({ kernel, plugins, writeLine }) {
+async function runRepl({ kernel, plugins, writeLine: rawWriteLine }) {
+  const writeLine = makeBatchedWriter(rawWriteLine);
   const rl = readline.createInterface({
     input: process.stdin,
     crlfDelay: Infinity
   });
 
-  let chain = Promise.resolve();
+  // Settles when the last state-changing request has finished.
+  let serialTail = Promise.resolve();
+  // Parallel-safe requests started since serialTail.
+  let inflight = [];
+  // Response writer, in request order.
+  let output = Promise.resolve();
+  let pending = 0;
+  let paused = false;
+
+  const settle = () => {
+    pending--;
+    if (paused && pending < QUEUE_HIGH_WATER / 2) {
+      paused = false;
+      rl.resume();
+    }
+  };
 
   rl.on('line', (line) => {
     const trimmed = String(line || '').trim();
     if (!trimmed) return;
 
-    chain = chain.then(async () => {
-      let req;
-      try {
-        req = JSON.parse(trimmed);
-      } catch {
-        writeLine({ ok: false, error: { name: 'ParseError', message: 'Invalid JSON line' } });
-        return;
-      }
+    pending++;
+    if (!paused && pending >= QUEUE_HIGH_WATER) {
+      paused = true;
+      rl.pause();
+    }
 
-      const corr = pickCorrelation(req);
-      const startTime = Date.now();
-
-      try {
-        const cmdRaw = (req && req.cmd) ? String(req.cmd) : '';
-        const cmd = cmdRaw.trim().toUpperCase();
-
-        let res;
-
-        // Legacy REPL protocol mapping.
-        if (cmd === 'PING') {
-          res = await kernel.runCommand('ping', { argv: [] });
-        } else if (cmd === 'STATUS') {
-          res = await kernel.runCommand('status', { argv: [] });
-        } else if (cmd === 'GOTO') {
-          res = await kernel.runCommand('goto', { argv: [String(req.url || '')] });
-        } else if (cmd === 'SCAN') {
-          res = await kernel.runCommand('scan', { argv: [] });
-        } else if (cmd === 'SCANALL') {
-          res = await kernel.runCommand('scanall', { argv: [] });
-        } else if (cmd === 'SCROLL') {
-          res = await kernel.runCommand('scroll', { argv: [String(req.direction || 'down')] });
-        } else if (cmd === 'ACT') {
-          res = await kernel.runCommand('act', req);
-        } else {
-          // Direct command passthrough: { cmd: "click", argv: ["5"] }
-          if (req && req.cmd && Array.isArray(req.argv)) {
-            res = await kernel.runCommand(String(req.cmd).toLowerCase(), { argv: req.argv });
-          } else {
-            throw new Error(`Unknown cmd: ${cmd}`);
-          }
-        }
-
-        if (corr !== null && corr !== undefined && res && typeof res === 'object') res.corr = corr;
-        writeLine(res, startTime);
-      } catch (e) {
-        const out = { ok: false, error: serializeError(e) };
-        if (corr !== null && corr !== undefined) out.corr = corr;
-        writeLine(out, startTime);
+    let req;
+    let done;
+    try {
+      req = JSON.parse(trimmed);
+    } catch {
+      done = Promise.resolve({ out: { ok: false, error: { name: 'ParseError', message: 'Invalid JSON line' } } });
+    }
+
+    if (!done) {
+      if (PARALLEL_SAFE.has(_commandName(req))) {
+        done = serialTail.then(() => _execute(kernel, req));
+        inflight.push(done);
+      } else {
+        const barrier = inflight.length ? Promise.all([serialTail, ...inflight]) : serialTail;
+        done = barrier.then(() => _execute(kernel, req));
+        serialTail = done;
+        inflight = [];
       }
+    }
+
+    output = output.then(() => done).then(({ out, startTime }) => {
+      writeLine(out, startTime);
     }).catch((e) => {
       writeLine({ ok: false, error: serializeError(e) });
-    });
+    }).finally(settle);
   });
 
   rl.on('close', async () => {
+    // Finish every queued request (output settles after the last write), then
+    // uncork: corked output would be lost on process.exit().
+    await output;
+    writeLine.flush();
     await plugins.unloadAll().catch(() => {});
     await kernel.shutdown().catch(() => {});
     process.exit(0);
@@ -1,18 +1,27 @@
 'use strict';
 
+const CORR_KEYS = ['rpcId', 'reqId', 'requestId', 'corrId', 'correlationId', 'seq'];
+
+function _str(v) {
+  return typeof v === 'string' ? v : String(v);
+}
+
 function serializeError(err) {
-  const message = (err && err.message) ? String(err.message) : String(err || 'Unknown error');
-  const name = (err && err.name) ? String(err.name) : 'Error';
-  const code = (err && err.code) ? String(err.code) : undefined;
-  const out = { name, message };
-  if (code) out.code = code;
+  if (!err) return { name: 'Error', message: 'Unknown error' };
+  const { message, name, code } = err;
+  const out = {
+    name: name ? _str(name) : 'Error',
+    message: message ? _str(message) : String(err)
+  };
+  if (code) out.code = _str(code);
   return out;
 }
 
 function pickCorrelation(req) {
-  const keys = ['rpcId', 'reqId', 'requestId', 'corrId', 'correlationId', 'seq'];
-  for (const k of keys) {
-    if (req && Object.prototype.hasOwnProperty.call(req, k)) return req[k];
+  if (!req || typeof req !== 'object') return null;
+  for (let i = 0; i < CORR_KEYS.length; i++) {
+    const v = req[CORR_KEYS[i]];
+    if (v !== undefined) return v;
   }
   return null;
 }
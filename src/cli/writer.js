@@ -7,26 +7,32 @@ const { formatText } = require('./format-text');
  * - --json / -j: compact JSONL (for programmatic use)
  * - --pretty: JSON pretty printed
  * - default: colorful text format (Vite/Vitest style)
+ *
+ * The output mode is resolved once; the returned writer has no per-call branching.
  */
 function makeWriter(argv) {
   const args = Array.isArray(argv) ? argv : [];
-  const JSON_LINE = args.includes('--json') || args.includes('-j');
-  const PRETTY_JSON = args.includes('--pretty');
+  const JSON_LINE = args.indexOf('--json') !== -1 || args.indexOf('-j') !== -1;
+  const PRETTY_JSON = args.indexOf('--pretty') !== -1;
+  const stdout = process.stdout;
+
+  let render;
+  if (JSON_LINE) {
+    render = (obj) => JSON.stringify(obj);
+  } else if (PRETTY_JSON) {
+    render = (obj) => JSON.stringify(obj, null, 2);
+  } else {
+    render = (obj, startTime) => formatText(obj, startTime);
+  }
 
   return (obj, startTime) => {
     // 检查并显示标签页内存警告
     if (obj && obj._tabWarning) {
-      process.stdout.write(`${obj._tabWarning}\n`);
+      stdout.write(`${obj._tabWarning}\n`);
       delete obj._tabWarning;
     }
-    
-    if (JSON_LINE) {
-      process.stdout.write(`${JSON.stringify(obj)}\n`);
-    } else if (PRETTY_JSON) {
-      process.stdout.write(`${JSON.stringify(obj, null, 2)}\n`);
-    } else {
-      process.stdout.write(`${formatText(obj, startTime)}\n`);
-    }
+
+    stdout.write(`${render(obj, startTime)}\n`);
   };
 }
 
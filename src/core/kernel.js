@@ -23,8 +23,17 @@ const { withTimeout } = require('../utils/async');
 const { isRetryableError } = require('../utils/errors');
 
 
-// Shared allowlist to avoid allocating a Set on every CDPClient.enable() call.
-const NEEDS_ENABLE_DOMAINS = new Set(['Page', 'DOM', 'Runtime', 'Accessibility', 'Network', 'Log', 'Overlay', 'Emulation']);
+// Shared allowlist for CDPClient.enable(); a frozen null-prototype object keeps the check a plain property load.
+const NEEDS_ENABLE_DOMAINS = Object.freeze(Object.assign(Object.create(null), {
+  Page: true,
+  DOM: true,
+  Runtime: true,
+  Accessibility: true,
+  Network: true,
+  Log: true,
+  Overlay: true,
+  Emulation: true
+}));
 
 /**
  * Ultra-light EventBus:
@@ -160,19 +169,12 @@ class CDPClient {
     if (this._enabled.has(d)) return;
 
     // some domains do not require enable; keep allowlist (shared)
-
-
-    if (!NEEDS_ENABLE_DOMAINS.has(d)) {
-
-
+    if (!NEEDS_ENABLE_DOMAINS[d]) {
       this._enabled.add(d);
-
-
       return;
-
-
     }
-const method = `${d}.enable`;
+
+    const method = `${d}.enable`;
     try {
       await this.send(method, {}, { timeoutMs: this._enableTimeoutMs, label: `enable:${d}` });
       this._enabled.add(d);
@@ -240,6 +242,9 @@ class Kernel {
     /** @type {import('puppeteer-core').Page|null} */
     this._page = null;
 
+    /** @type {Promise<import('puppeteer-core').Page>|null} in-flight page selection, shared by concurrent callers */
+    this._pagePending = null;
+
     /** @type {boolean} */
     this._browserBound = false;
 
@@ -308,11 +313,22 @@ class Kernel {
    * Choose a "best" page:
    * - ignore devtools + extensions
    * - prefer a visible tab if possible
+   *
+   * Overlapping callers share one in-flight selection, so a cold kernel never opens two tabs.
    */
   async page() {
     await this.browser();
     if (this._page && !this._page.isClosed()) return this._page;
 
+    if (!this._pagePending) {
+      this._pagePending = this._selectPage().finally(() => {
+        this._pagePending = null;
+      });
+    }
+    return this._pagePending;
+  }
+
+  async _selectPage() {
     let pages = [];
     try {
       pages = await this._browser.pages();
@@ -504,12 +520,19 @@ class Kernel {
   }
 
   /**
-   * Run a command by name.
-   * ctx: {argv?:string[], ...}
-   * @param {string} name
-   * @param {any} ctx
+   * Normalize a command name (trim + lowercase).
+   * Skips the trim copy when both ends are already printable ASCII, which is the common case.
+   * @param {any} name
+   * @returns {string}
    */
-
+  _normalizeName(name) {
+    const s = typeof name === 'string' ? name : String(name || '');
+    if (!s) return s;
+    const first = s.charCodeAt(0);
+    const last = s.charCodeAt(s.length - 1);
+    if (first > 32 && first < 127 && last > 32 && last < 127) return s.toLowerCase();
+    return s.trim().toLowerCase();
+  }
 
 /**
  * Get detailed command info for help/introspection.
@@ -517,15 +540,21 @@ class Kernel {
  * @returns {{name:string, plugin:string, spec:any}|null}
  */
 getCommandInfo(name) {
-  const cmd = String(name || '').trim().toLowerCase();
+  const cmd = this._normalizeName(name);
   if (!cmd) return null;
   const rec = this._commands.get(cmd);
   if (!rec) return null;
   return { name: cmd, plugin: rec.plugin, spec: rec.spec };
 }
 
+  /**
+   * Run a command by name.
+   * ctx: {argv?:string[], ...}
+   * @param {string} name
+   * @param {any} ctx
+   */
   async runCommand(name, ctx = {}) {
-    const cmd = String(name || '').trim().toLowerCase();
+    const cmd = this._normalizeName(name);
     const rec = this._commands.get(cmd);
     if (!rec) {
       const err = new Error(`Unknown command: ${cmd}`);
@@ -243,8 +243,14 @@ class PluginManager {
  * @returns {Array<any>}
  */
 listPluginMetas() {
-  const metas = Array.from(this._loaded.values()).map((r) => r.meta);
-  metas.sort((a, b) => String(a.name).localeCompare(String(b.name)));
+  const metas = [];
+  for (const r of this._loaded.values()) metas.push(r.meta);
+  // Plugin names are plain ASCII ids; code-unit order avoids localeCompare's ICU collation.
+  metas.sort((a, b) => {
+    const an = String(a.name);
+    const bn = String(b.name);
+    return an < bn ? -1 : (an > bn ? 1 : 0);
+  });
   return metas;
 }
 
@@ -10,11 +10,20 @@ const { PluginManager } = require('./core/plugin-manager');
 const { red } = require('./utils/colors');
 
 const { parseCliArgs } = require('./cli/args');
-const { makeWriter } = require('./cli/writer');
-const { printBanner } = require('./cli/banner');
-const { buildHelpText } = require('./cli/help');
-const { runRepl } = require('./cli/repl');
-const { serializeError } = require('./cli/serialize');
+// Other CLI modules (writer/format-text, help, banner, repl, serialize) are
+// required lazily in the mode that needs them to keep cold start small.
+
+const BIN_NAME = 'pup';
+const PLUGINS_DIR = path.join(__dirname, 'plugins');
+
+/**
+ * Unload plugins, then shut the kernel down; errors are ignored.
+ * Order matters: onUnload(kernel) hooks (including external .pup plugins) may still use the kernel.
+ */
+async function teardown(kernel, plugins) {
+  await plugins.unloadAll().catch(() => {});
+  await kernel.shutdown().catch(() => {});
+}
 
 async function boot(pluginsDir, externalPluginsDirs = []) {
   const kernel = new Kernel(config);
@@ -35,8 +44,7 @@ async function boot(pluginsDir, externalPluginsDirs = []) {
 
   if (loadError) {
     console.error(`${red('[-]')} ${red('Failed to load plugins:')} ${loadError.message}`);
-    await plugins.unloadAll().catch(() => {});
-    await kernel.shutdown().catch(() => {});
+    await teardown(kernel, plugins);
     process.exit(1);
   }
 
@@ -48,8 +56,8 @@ async function boot(pluginsDir, externalPluginsDirs = []) {
 
 async function main() {
   const rawArgs = process.argv.slice(2);
-  const binName = 'pup';
-  const pluginsDir = path.join(__dirname, 'plugins');
+  const binName = BIN_NAME;
+  const pluginsDir = PLUGINS_DIR;
   
   // 外部插件目录: 当前目录/.pup 和 用户目录/.pup
   const fs = require('fs');
@@ -69,41 +77,50 @@ async function main() {
   }
 
   const parsed = parseCliArgs(rawArgs);
-  const writeLine = makeWriter(rawArgs);
 
   const { kernel, plugins } = await boot(pluginsDir, externalPluginsDirs);
 
   // Help (dynamic)
   if (parsed.mode === 'help') {
+    const { printBanner } = require('./cli/banner');
+    const { buildHelpText } = require('./cli/help');
     printBanner();
     process.stdout.write(buildHelpText({ kernel, plugins, binName, topicTokens: parsed.helpTopicTokens }));
     process.stdout.write('\n');
-    await plugins.unloadAll().catch(() => {});
-    await kernel.shutdown().catch(() => {});
+    await teardown(kernel, plugins);
     process.exit(0);
   }
 
+  const { makeWriter } = require('./cli/writer');
+  const writeLine = makeWriter(rawArgs);
+
   // CLI command mode
   if (parsed.mode === 'command') {
-    const cmd = String(parsed.command || '').trim().toLowerCase();
+    // parseCliArgs already trims/lowercases; Kernel#runCommand normalizes defensively.
+    const cmd = parsed.command;
     const argv = Array.isArray(parsed.argv) ? parsed.argv : [];
-    const startTime = Date.now();
+    const startTime = process.hrtime.bigint();
 
+    // Teardown starts as soon as the command settles so it overlaps with
+    // rendering/writing the result; it is started (and awaited) exactly once.
+    let done = null;
+    let exitCode = 0;
     try {
       const res = await kernel.runCommand(cmd, { argv });
+      done = teardown(kernel, plugins);
       writeLine(res, startTime);
-      await plugins.unloadAll().catch(() => {});
-      await kernel.shutdown().catch(() => {});
-      process.exit(0);
     } catch (e) {
+      done = done || teardown(kernel, plugins);
+      exitCode = 1;
+      const { serializeError } = require('./cli/serialize');
       writeLine({ ok: false, error: serializeError(e) }, startTime);
-      await plugins.unloadAll().catch(() => {});
-      await kernel.shutdown().catch(() => {});
-      process.exit(1);
     }
+    await done;
+    process.exit(exitCode);
   }
 
   // REPL mode
+  const { runRepl } = require('./cli/repl');
   await runRepl({ kernel, plugins, writeLine });
 }
 
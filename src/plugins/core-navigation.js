@@ -78,17 +78,19 @@ async function detectBlankPage(kernel) {
       
 
 // 检查可见元素数量（性能优化：计数到阈值后提前退出）
-const nodes = body.querySelectorAll('*');
+// TreeWalker yields nodes lazily, so the early exit skips materializing the full NodeList.
+const walker = document.createTreeWalker(body, NodeFilter.SHOW_ELEMENT);
 let visibleCount = 0;
 const needVisibleThreshold = 5;
 const earlyExitAt = needVisibleThreshold + 1;
 
-for (let i = 0; i < nodes.length; i++) {
-  const el = nodes[i];
-  const style = window.getComputedStyle(el);
-  if (style.display === 'none' || style.visibility === 'hidden') continue;
+let el;
+while ((el = walker.nextNode())) {
+  // Cheap layout read first; only non-empty boxes pay for style resolution.
   const rect = el.getBoundingClientRect();
   if (rect.width <= 0 || rect.height <= 0) continue;
+  const style = window.getComputedStyle(el);
+  if (style.display === 'none' || style.visibility === 'hidden') continue;
   visibleCount += 1;
   if (visibleCount >= earlyExitAt) break;
 }
@@ -197,11 +197,11 @@ async function scanViewport(kernel) {
     if (candidates.length >= maxElements * 3) break; // avoid extreme trees
   }
 
-  // Deduplicate by backendNodeId
+  // Deduplicate by backendNodeId (already numeric; no string key needed)
   const seen = new Set();
   const unique = [];
   for (const c of candidates) {
-    const k = String(c.backendDOMNodeId);
+    const k = c.backendDOMNodeId;
     if (seen.has(k)) continue;
     seen.add(k);
     unique.push(c);
@@ -214,24 +214,25 @@ const rawElements = [];
 const truncated = unique.length > maxElements;
 
 const CONCURRENCY = 8; // conservative; do NOT change timeouts/design
-for (let offset = 0; offset < unique.length && rawElements.length < maxElements; offset += CONCURRENCY) {
-  const batch = unique.slice(offset, offset + CONCURRENCY);
 
-  const batchModels = await Promise.all(batch.map(async (c) => {
-    try {
-      const model = await domGetBoxModel(cdp, c.backendDOMNodeId);
-      return { c, model };
-    } catch {
-      return null;
-    }
-  }));
+// Streaming pool: a new BoxModel request starts as soon as any in-flight one settles.
+// Models are consumed strictly in candidate order, so the maxElements cap picks the same elements.
+// Fetches are also windowed: a worker waits while the unconsumed fetches ahead of it
+// could already fill the remaining slots, so total calls stay close to the cap.
+const models = new Array(unique.length);
+let consumed = 0;
+let waiters = [];
 
-  for (const item of batchModels) {
-    if (!item || !item.model) continue;
-    if (rawElements.length >= maxElements) break;
+const waitForProgress = () => new Promise((resolve) => waiters.push(resolve));
 
-    const c = item.c;
-    const model = item.model;
+const consume = () => {
+  const before = consumed;
+  while (consumed < unique.length && models[consumed] !== undefined) {
+    const c = unique[consumed];
+    const model = models[consumed];
+    consumed++;
+
+    if (!model || rawElements.length >= maxElements) continue;
 
     // prefer border quad
     const quad = model.border || model.content;
@@ -256,7 +257,29 @@ for (let offset = 0; offset < unique.length && rawElements.length < maxElements;
       backendDOMNodeId: c.backendDOMNodeId
     });
   }
-}
+
+  if (consumed !== before && waiters.length) {
+    const wake = waiters;
+    waiters = [];
+    for (const resolve of wake) resolve();
+  }
+};
+
+await pMap(unique, async (c, idx) => {
+  // Don't run ahead: fetches in [consumed, idx) may already fill the remaining slots.
+  while (rawElements.length < maxElements && idx - consumed >= maxElements - rawElements.length) {
+    await waitForProgress();
+  }
+  // Enough elements collected: skip remaining fetches.
+  if (rawElements.length >= maxElements) return;
+
+  let model = null;
+  try {
+    model = await domGetBoxModel(cdp, c.backendDOMNodeId);
+  } catch {}
+  models[idx] = model || null;
+  consume();
+}, { concurrency: CONCURRENCY, stopOnError: false });
 
 // 按视觉位置排序，优先显示视口内完全可见的元素
 // 1. 部分超出视口的元素（右边缘超出）排在后面
@@ -344,86 +367,137 @@ while (i < rawElements.length) {
   return result;
 }
 
+/**
+ * Page-side text extractor for enhanceWithDOM. Receives the target nodes as
+ * arguments and returns one string per node ('' when nothing was found).
+ * Kept as a module constant so the source is built once, not per scan.
+ */
+const ENHANCE_TEXT_FN = `function() {
+  // Compiled once per call, shared by every node
+  const RATING_RE = /(\\d+(?:\\.\\d+)?) out of 5/;
+
+  const extract = (el) => {
+    try {
+      // 标题 | 价格 | 评分，最后一次 join
+      const parts = [];
+
+      // 查找产品标题
+      const titleEl = el.querySelector('h2, h2 a, [data-cy="title-recipe"], .a-text-normal, .a-link-normal .a-text-normal');
+      if (titleEl) {
+        const title = (titleEl.innerText || titleEl.textContent || '').trim();
+        if (title) parts.push(title);
+      }
+
+      // 查找价格
+      const priceEl = el.querySelector('.a-price .a-offscreen, .a-price-whole');
+      if (priceEl) {
+        const price = (priceEl.textContent || '').trim();
+        if (price.charCodeAt(0) === 0x24) parts.push(price); // '$'
+      }
+
+      // 查找评分
+      const ratingEl = el.querySelector('[aria-label*="out of 5"], .a-icon-alt');
+      if (ratingEl) {
+        const rating = ratingEl.getAttribute('aria-label') || '';
+        const match = RATING_RE.exec(rating);
+        if (match) parts.push('★' + match[1]);
+      }
+
+      let text = parts.join(' | ');
+
+      // 如果没有找到特定内容，使用 innerText 的前 80 字符
+      if (!text) {
+        text = (el.innerText || '').substring(0, 80).replace(/\\n+/g, ' ').trim();
+      }
+
+      return text.substring(0, 100);
+    } catch (e) {
+      return '';
+    }
+  };
+
+  const out = [];
+  for (let i = 0; i < arguments.length; i++) out.push(extract(arguments[i]));
+  return out;
+}`;
+
+let _enhanceSeq = 0;
+
 /**
  * DOM 增强扫描 - 获取更丰富的文本内容
  * 用于 listitem 等元素，AXTree 可能没有完整的文本
  */
 async function enhanceWithDOM(kernel, elements) {
-  const cdp = await kernel.cdp();
-  await cdp.enable('DOM');
-  await cdp.enable('Runtime');
-
   const list = Array.isArray(elements) ? elements : [];
   const CONCURRENCY = 3; // conservative; avoids overloading Runtime/DOM
 
-  const enhanced = await pMap(list, async (el) => {
+  // 只增强文本不足的 listitem 和 generic 类型
+  // Partition before any CDP work: when nothing qualifies, skip domain setup entirely.
+  const targets = [];
+  for (let i = 0; i < list.length; i++) {
+    const el = list[i];
+    if (!el) continue;
     // 如果已经有足够的文本，跳过
-    if (el.text && el.text.length > 30) return el;
+    if (el.text && el.text.length > 30) continue;
+    if (el.type !== 'listitem' && el.type !== 'generic') continue;
+    targets.push(i);
+  }
+  if (!targets.length) return list;
+
+  const cdp = await kernel.cdp();
+  await Promise.all([cdp.enable('DOM'), cdp.enable('Runtime')]);
 
-    // 只增强 listitem 和 generic 类型
-    if (el.type !== 'listitem' && el.type !== 'generic') return el;
+  // All handles go into one object group, released with a single call afterwards.
+  const objectGroup = `pup-enhance-${++_enhanceSeq}`;
 
+  // 使用 backendDOMNodeId 精确定位元素
+  const objectIds = await pMap(targets, async (i) => {
     try {
-      // 使用 backendDOMNodeId 精确定位元素
       const resolved = await cdp.send('DOM.resolveNode', {
-        backendNodeId: el.backendDOMNodeId
+        backendNodeId: list[i].backendDOMNodeId,
+        objectGroup
       }, { timeoutMs: 1500, label: 'DOM.resolveNode(enhance)' });
-
-      if (!resolved || !resolved.object || !resolved.object.objectId) return el;
-
-      const result = await cdp.send('Runtime.callFunctionOn', {
-        objectId: resolved.object.objectId,
-        functionDeclaration: `function() {
-          try {
-            const el = this;
-            let text = '';
-
-            // 查找产品标题
-            const titleEl = el.querySelector('h2, h2 a, [data-cy="title-recipe"], .a-text-normal, .a-link-normal .a-text-normal');
-            if (titleEl) {
-              text = (titleEl.innerText || titleEl.textContent || '').trim();
-            }
-
-            // 查找价格
-            const priceEl = el.querySelector('.a-price .a-offscreen, .a-price-whole');
-            if (priceEl) {
-              const price = (priceEl.textContent || '').trim();
-              if (price && price.startsWith('$')) {
-                text += text ? ' | ' + price : price;
-              }
-            }
-
-            // 查找评分
-            const ratingEl = el.querySelector('[aria-label*="out of 5"], .a-icon-alt');
-            if (ratingEl) {
-              const rating = ratingEl.getAttribute('aria-label') || '';
-              const match = rating.match(/([\\d.]+) out of 5/);
-              if (match) {
-                text += text ? ' | ★' + match[1] : '★' + match[1];
-              }
-            }
-
-            // 如果没有找到特定内容，使用 innerText 的前 80 字符
-            if (!text) {
-              text = (el.innerText || '').substring(0, 80).replace(/\\n+/g, ' ').trim();
-            }
-
-            return { ok: true, text: text.substring(0, 100) };
-          } catch (e) {
-            return { ok: false, error: String(e) };
-          }
-        }`,
-        returnByValue: true
-      }, { timeoutMs: 2000, label: 'enhance(callFunctionOn)' });
-
-      const v = result && result.result ? result.result.value : null;
-      if (v && v.ok && v.text) return { ...el, text: v.text };
-      return el;
+      return resolved && resolved.object && resolved.object.objectId ? resolved.object.objectId : null;
     } catch {
-      return el;
+      return null;
     }
   }, { concurrency: CONCURRENCY, stopOnError: false });
 
+  const resolvedIdx = [];
+  const args = [];
+  for (let k = 0; k < targets.length; k++) {
+    if (!objectIds[k]) continue;
+    resolvedIdx.push(targets[k]);
+    args.push({ objectId: objectIds[k] });
+  }
+  if (!args.length) return list;
+
+  // 一次 callFunctionOn 处理所有节点（节点作为参数传入），而不是每个节点一次往返
+  let texts = null;
+  try {
+    const result = await cdp.send('Runtime.callFunctionOn', {
+      objectId: args[0].objectId,
+      functionDeclaration: ENHANCE_TEXT_FN,
+      arguments: args,
+      returnByValue: true
+    }, { timeoutMs: 2000, label: 'enhance(callFunctionOn)' });
+
+    const v = result && result.result ? result.result.value : null;
+    if (Array.isArray(v)) texts = v;
+  } catch {
+    // best effort: leave elements unchanged
+  } finally {
+    // Fire-and-forget: freeing the handles must not add a round trip to scan latency.
+    cdp.send('Runtime.releaseObjectGroup', { objectGroup }, { timeoutMs: 1000, label: 'enhance(releaseObjectGroup)' })
+      .catch(() => {});
+  }
+  if (!texts) return list;
+
+  const enhanced = list.slice();
+  for (let k = 0; k < resolvedIdx.length; k++) {
+    const text = texts[k];
+    if (text) enhanced[resolvedIdx[k]] = { ...list[resolvedIdx[k]], text };
+  }
   return enhanced;
 }
 
@@ -15,19 +15,22 @@
  */
 async function pMap(items, worker, opts = {}) {
   const list = Array.isArray(items) ? items : [];
-  const concurrency = Math.max(1, Number(opts.concurrency || 4));
+  const concurrency = Math.max(1, Math.floor(Number(opts.concurrency) || 4));
   const stopOnError = opts.stopOnError !== false;
 
-  const results = new Array(list.length);
-  let nextIndex = 0;
+  const total = list.length;
+  // Built by push rather than new Array(n) so V8 keeps it packed (no holes) for callers.
+  const results = [];
+  for (let i = 0; i < total; i++) results.push(null);
+  let cursor = 0;
   let failed = false;
   let firstError = null;
 
+  // Exactly `concurrency` long-lived workers pull from a shared cursor.
   async function runOne() {
-    while (true) {
+    while (cursor < total) {
       if (failed && stopOnError) return;
-      const i = nextIndex++;
-      if (i >= list.length) return;
+      const i = cursor++;
 
       try {
         results[i] = await worker(list[i], i);
@@ -35,14 +38,14 @@ async function pMap(items, worker, opts = {}) {
         if (!firstError) firstError = e;
         failed = true;
         if (stopOnError) return;
-        results[i] = null;
       }
     }
   }
 
-  const workers = [];
-  for (let i = 0; i < Math.min(concurrency, list.length); i++) {
-    workers.push(runOne());
+  const workerCount = Math.min(concurrency, total);
+  const workers = new Array(workerCount);
+  for (let i = 0; i < workerCount; i++) {
+    workers[i] = runOne();
   }
   await Promise.all(workers);
 